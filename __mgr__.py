@@ -1,9 +1,12 @@
-import os, json, time, shutil, argparse, subprocess, sys, platform
+import os, json, time, shutil, argparse, subprocess, sys, platform, functools, selectors, threading, stat, csv, re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from types import MappingProxyType
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_DIR = os.path.join(SCRIPT_DIR, "config")
 LOG_FILE = os.path.join(CONFIG_DIR, "build.log")
+IO_CHUNK_SIZE = 64 * 1024  # Buffer size for log writes and subprocess output reads
 
 # Platform detection for cross-platform compatibility
 IS_WINDOWS = platform.system() == "Windows"
@@ -13,6 +16,12 @@ IS_LINUX = platform.system() == "Linux"
 # Colorama for colored terminal output
 try:
     from colorama import init, Fore, Style
+    HAS_COLORAMA = True
+except ImportError:
+    HAS_COLORAMA = False
+
+# Escape codes are only useful on a terminal, so piped or redirected output stays plain.
+if HAS_COLORAMA and sys.stdout.isatty():
     init(autoreset=True)
     RRR = Style.RESET_ALL
     BRT = Style.BRIGHT
@@ -23,15 +32,15 @@ try:
     BLU = Fore.BLUE
     MGN = Fore.MAGENTA
     CYN = Fore.CYAN
-except ImportError:
-    # Fallback for systems without colorama
+else:
+    # Fallback for systems without colorama, or when stdout is not a TTY
     RRR = BRT = DIM = RED = GRN = YLW = BLU = MGN = CYN = ""
 
 # Files and folders to exclude during cleaning and tree views
 JSPROJECT_EXCLUDE = {".svelte-kit", "dist", "node_modules", "package-lock.json", "build"}
 PYPROJECT_EXCLUDE = {"__pycache__", "venv"}
 RSPROJECT_EXCLUDE = {"target", "Cargo.lock"}
-EXCLUDE_ALL = {"build.log", ".vscode", "dox"} | PYPROJECT_EXCLUDE | JSPROJECT_EXCLUDE | RSPROJECT_EXCLUDE
+EXCLUDE_ALL = frozenset({"build.log", ".vscode", "dox"} | PYPROJECT_EXCLUDE | JSPROJECT_EXCLUDE | RSPROJECT_EXCLUDE)
 
 # Exclusions for the tree view should be more comprehensive
 TREE_EXCLUDE = EXCLUDE_ALL | {".git"}
@@ -55,43 +64,48 @@ PROG_LANG_EXTS = {
 
 # --- Configuration Reading Functions ---
 
+@functools.lru_cache(maxsize=None)
 def read_tauri_config(root_dir: str):
-    """Reads and parses the tauri.conf.json file to extract dynamic configuration."""
+    """Reads and parses the tauri.conf.json file to extract dynamic configuration.
+
+    The result is cached per root directory and returned as a read-only mapping.
+    """
     config_path = os.path.join(root_dir, "tauri.conf.json")
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
             config = json.load(f)
         
         product_name = config.get("package", {}).get("productName", "tauri-app")
-        return {
+        return MappingProxyType({
             "product_name": product_name,
             "app_name": product_name.lower().replace(" ", "-"),
             "identifier": config.get("tauri", {}).get("bundle", {}).get("identifier", "com.example.app")
-        }
+        })
     except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
         print(f"{YLW}Warning: Could not read tauri.conf.json ({e}). Using defaults.{RRR}", flush=True)
-        return {
+        return MappingProxyType({
             "product_name": "Tauri App",
             "app_name": "tauri-app", 
             "identifier": "com.example.app"
-        }
+        })
 
+@functools.lru_cache(maxsize=None)
 def get_platform_commands():
-    """Returns platform-specific commands for npm and process management."""
+    """Returns platform-specific commands for npm and process management (cached, read-only)."""
     if IS_WINDOWS:
-        return {
+        return MappingProxyType({
             "npm": "npm.cmd",
             "kill_cmd": "taskkill",
-            "kill_args": ["/F", "/T", "/IM"], # /T terminates child processes
+            "kill_args": ("/F", "/T"), # /T terminates child processes
             "executable_ext": ".exe"
-        }
+        })
     else:  # macOS and Linux
-        return {
+        return MappingProxyType({
             "npm": "npm",
-            "kill_cmd": "pkill", 
-            "kill_args": ["-f"],
+            "kill_cmd": "kill", 
+            "kill_args": ("-9",),
             "executable_ext": ""
-        }
+        })
 
 # --- Core Functions ---
 
@@ -101,43 +115,68 @@ def project_tree(root_dir: str, output: bool = False) -> str:
     stats = {"folders": 0, "files": {"total": 0, "by_type": {}}}
 
     def count_lines(path: str) -> int:
+        # Count newlines over raw byte blocks instead of decoding and iterating line by line.
         try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                return sum(1 for _ in f)
+            lines = 0
+            last = b""
+            with open(path, 'rb', buffering=0) as f:
+                while True:
+                    buf = f.read(1 << 20)
+                    if not buf:
+                        break
+                    lines += buf.count(b"\n")
+                    last = buf
+            # A final line without a trailing newline still counts as a line.
+            if last and not last.endswith(b"\n"):
+                lines += 1
+            return lines
         except (IOError, OSError):
             return 0
 
     def process_directory(dir_path: str, prefix: str = ""):
         """Recursively process a directory to build the tree."""
+        # os.scandir reuses the file type info from the directory listing, so the
+        # sort key and the dir/file branch below don't cost an extra stat per entry.
+        # The type flag is read once per entry and shared by both.
+        tree_exclude = TREE_EXCLUDE
         try:
-            entries = sorted(os.listdir(dir_path), key=lambda e: (os.path.isfile(os.path.join(dir_path, e)), e.lower()))
+            with os.scandir(dir_path) as it:
+                entries = [(not e.is_dir(follow_symlinks=False), e) for e in it if e.name not in tree_exclude]
         except OSError:
             return
-        
-        entries = [e for e in entries if e not in TREE_EXCLUDE]
-        
-        for i, entry in enumerate(entries):
-            path = os.path.join(dir_path, entry)
-            connector = "└── " if i == len(entries) - 1 else "├── "
-            
-            if os.path.isdir(path):
+
+        entries.sort(key=lambda t: (t[0], t[1].name.lower()))
+
+        # Bind hot lookups to locals once per directory rather than once per entry.
+        tree_lines_append = tree_lines.append
+        file_stats = stats["files"]
+        by_type = file_stats["by_type"]
+        splitext = os.path.splitext
+        lang_for_ext = PROG_LANG_EXTS.get
+        last_index = len(entries) - 1
+
+        for i, (is_file, entry) in enumerate(entries):
+            name = entry.name
+            connector = "└── " if i == last_index else "├── "
+
+            if not is_file:
                 stats["folders"] += 1
-                tree_lines.append(f"{prefix}{connector}{BRT}{BLU}{entry}{RRR}/")
-                extension = "    " if i == len(entries) - 1 else "│   "
-                process_directory(path, prefix + extension)
+                tree_lines_append(f"{prefix}{connector}{BRT}{BLU}{name}{RRR}/")
+                extension = "    " if i == last_index else "│   "
+                process_directory(entry.path, prefix + extension)
             else:
-                stats["files"]["total"] += 1
-                ext = os.path.splitext(entry)[1]
-                lang = PROG_LANG_EXTS.get(ext)
-                
+                file_stats["total"] += 1
+                ext = splitext(name)[1]
+                lang = lang_for_ext(ext)
+
                 if lang:
-                    lines = count_lines(path)
-                    lang_stats = stats["files"]["by_type"].setdefault(lang, {'files': 0, 'lines': 0})
+                    lines = count_lines(entry.path)
+                    lang_stats = by_type.setdefault(lang, {'files': 0, 'lines': 0})
                     lang_stats['files'] += 1
                     lang_stats['lines'] += lines
-                    tree_lines.append(f"{prefix}{connector}{entry} :: {GRN}{lines}{RRR} lines")
+                    tree_lines_append(f"{prefix}{connector}{name} :: {GRN}{lines}{RRR} lines")
                 else:
-                    tree_lines.append(f"{prefix}{connector}{entry}")
+                    tree_lines_append(f"{prefix}{connector}{name}")
 
     abs_root = os.path.abspath(root_dir)
     root_label = f"{BLU}{os.path.basename(abs_root.rstrip(os.sep))}{RRR}/"
@@ -146,8 +185,8 @@ def project_tree(root_dir: str, output: bool = False) -> str:
     
     file_tree_str = "\n".join(tree_lines)
     if output:
-        print(json.dumps(stats, indent=4), flush=True)
-        print(file_tree_str, flush=True)
+        # Emit the whole report in one write rather than flushing piece by piece.
+        sys.stdout.write(f"{json.dumps(stats, indent=4)}\n{file_tree_str}\n")
     
     return file_tree_str
 
@@ -176,43 +215,46 @@ def clean_project(root_dir: str, output: bool = False, force: bool = False):
     stop_dev_servers(root_dir, output)
     
     # Efficiently find all items to be cleaned, without descending into excluded directories.
-    paths_to_remove = []
-    for root, dirs, files in os.walk(root_dir, topdown=True):
-        # Prune the directories list in-place to prevent os.walk from descending into them.
-        # We iterate over a copy of dirs `list(dirs)` because we modify it.
-        for d in list(dirs):
-            if d in EXCLUDE_ALL:
-                full_path = os.path.join(root, d)
-                paths_to_remove.append(full_path)
-                dirs.remove(d)  # This is the key optimization
-
-        # Add any matching files from the current directory.
-        for f in files:
-            if f in EXCLUDE_ALL:
-                paths_to_remove.append(os.path.join(root, f))
-
-    if not paths_to_remove:
+    # os.scandir's DirEntry caches the file type from the listing, so no extra stat is needed,
+    # and files are sized as they are found rather than in a second pass.
+    files_to_delete = []
+    dirs_to_delete = []
+
+    def scan_directory(dir_path: str):
+        """Recursively collect excluded entries, without descending into them."""
+        exclude = EXCLUDE_ALL
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if entry.name in exclude:
+                        # Excluded folders are pruned here and never descended into.
+                        if is_dir:
+                            dirs_to_delete.append({'path': entry.path})
+                        else:
+                            try:
+                                files_to_delete.append({'path': entry.path, 'size': entry.stat(follow_symlinks=False).st_size})
+                            except OSError:
+                                continue
+                    elif is_dir:
+                        scan_directory(entry.path)
+        except OSError:
+            return
+
+    scan_directory(root_dir)
+
+    if not files_to_delete and not dirs_to_delete:
         if output:
             print(f"{GRN}Project is already clean. No items to remove.{RRR}", flush=True)
         return
 
-    # Separate paths into files and directories
-    files_to_delete = []
-    dirs_to_delete = []
-    for p in paths_to_remove:
-        if os.path.isfile(p):
-            try:
-                files_to_delete.append({'path': p, 'size': os.path.getsize(p)})
-            except OSError:
-                continue 
-        elif os.path.isdir(p):
-            dirs_to_delete.append({'path': p})
-
     # As requested, sort files by size (smallest to largest)
     files_to_delete.sort(key=lambda f: f['size'])
-    
+    file_paths = [f['path'] for f in files_to_delete]
+    dir_paths = [d['path'] for d in dirs_to_delete]
+
     # The final list for deletion: files first, then directories.
-    items_to_clean = [f['path'] for f in files_to_delete] + [d['path'] for d in dirs_to_delete]
+    items_to_clean = file_paths + dir_paths
 
     if output and not force:
         print(f"{YLW}The following items will be removed (files first, then folders):{RRR}", flush=True)
@@ -227,52 +269,59 @@ def clean_project(root_dir: str, output: bool = False, force: bool = False):
             return
 
     # Separate the log file from other items to avoid a file lock conflict.
+    # Normalized paths are compared as strings, so no stat calls are needed.
+    log_file_abs = os.path.normcase(os.path.abspath(LOG_FILE))
     log_file_path_to_delete = None
-    items_for_main_loop = []
-    for item in items_to_clean:
+    files_for_main_loop = []
+    for item in file_paths:
+        if os.path.normcase(os.path.abspath(item)) == log_file_abs:
+            log_file_path_to_delete = item
+        else:
+            files_for_main_loop.append(item)
+
+    # Removals run concurrently, so log writes and console output are serialized.
+    log_lock = threading.Lock()
+
+    def remove_item(item_path: str, remover):
+        """Removes a single entry with the remover matching its scanned kind, logging the outcome."""
+        with log_lock:
+            log.write(f"Attempting to remove: {item_path}\n")
+            if output:
+                print(f"{DIM}Attempting to remove: {item_path}...{RRR}")
+
         try:
-            if os.path.exists(item) and os.path.samefile(item, LOG_FILE):
-                log_file_path_to_delete = item
-            else:
-                items_for_main_loop.append(item)
+            remover(item_path)
         except FileNotFoundError:
-            continue
-            
-    with open(LOG_FILE, 'a', encoding='utf-8') as log:
+            with log_lock:
+                log.write(f"Already removed: {item_path}\n")
+            return
+        except OSError as e:
+            with log_lock:
+                log.write(f"Failed to remove {item_path}: {e}\n")
+                log.flush()
+                if output:
+                    print(f"{RED}Failed to remove {item_path}: {e}{RRR}")
+            return
+
+        with log_lock:
+            log.write(f"Successfully removed: {item_path}\n")
+            if output:
+                print(f"{GRN}Successfully removed: {item_path}{RRR}")
+
+    # The log is buffered and only flushed at phase boundaries or on failure.
+    with open(LOG_FILE, 'a', encoding='utf-8', buffering=IO_CHUNK_SIZE) as log:
         log.write(f"\n--- Starting Clean Operation at {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-        for item_path in items_for_main_loop: # Note: iterating over the filtered list
-            if not os.path.exists(item_path):
+        log.flush()
+        # Independent subtrees are removed in parallel; files still go before folders.
+        # The kind found during the scan picks the remover, so nothing is stat'ed again
+        # and symlinks (classified as files) are unlinked rather than followed.
+        # Progress lines are left to stdout's own buffering and flushed once per phase.
+        for batch, remover in ((files_for_main_loop, _remove_file), (dir_paths, _remove_tree)):
+            if not batch:
                 continue
-            
-            log.write(f"Attempting to remove: {item_path}\n")
-            log.flush()
-            
-            if output:
-                print(f"{DIM}Attempting to remove: {item_path}...{RRR}", end="", flush=True)
-
-            for attempt in range(3):
-                try:
-                    if os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-                    elif os.path.isfile(item_path):
-                        os.remove(item_path)
-                    
-                    log.write(f"Successfully removed: {item_path}\n")
-                    log.flush()
-
-                    if output:
-                        print(f"\r{GRN}Successfully removed: {item_path.ljust(80)}{RRR}", flush=True)
-                    break
-                except OSError as e:
-                    log.write(f"Failed attempt to remove {item_path}: {e}\n")
-                    log.flush()
-                    if attempt < 2:
-                        if output:
-                            print(f"\r{YLW}Could not remove {item_path}, retrying... ({e}){RRR}", flush=True)
-                        time.sleep(2)
-                    else:
-                        if output:
-                            print(f"\r{RED}Failed to remove {item_path}: {e}{RRR}", flush=True)
+            with ThreadPoolExecutor(max_workers=min(8, len(batch))) as pool:
+                list(pool.map(functools.partial(remove_item, remover=remover), batch))
+            sys.stdout.flush()
 
     # Now that the log file is closed, we can safely delete it.
     if log_file_path_to_delete:
@@ -289,6 +338,62 @@ def clean_project(root_dir: str, output: bool = False, force: bool = False):
 
 # --- Helper Functions ---
 
+def _handle_rm_error(func, path: str, exc: BaseException, root: str):
+    """Makes a read-only entry under `root` removable and retries the failed removal once.
+
+    Only permission errors from removal calls are handled. Anything else, including
+    rmtree's refusal to delete through a symlink, is re-raised unchanged.
+    """
+    if not isinstance(exc, PermissionError) or func not in (os.remove, os.unlink, os.rmdir):
+        raise exc
+
+    if IS_WINDOWS:
+        # Windows refuses to delete entries carrying the read-only attribute.
+        target = path
+    else:
+        # On POSIX, removing an entry needs write permission on its parent folder.
+        target = os.path.dirname(path)
+        # Never change permissions on anything outside the tree being removed.
+        if os.path.commonpath([root, target]) != root:
+            raise exc
+
+    try:
+        mode = os.lstat(target).st_mode
+        if stat.S_ISLNK(mode):
+            raise exc  # chmod would follow the link to its target
+        os.chmod(target, mode | stat.S_IWRITE)
+        func(path)
+    except OSError:
+        raise exc
+
+def _remove_file(path: str):
+    """Removes a single file or symlink, fixing up a read-only entry if needed."""
+    try:
+        os.remove(path)
+    except PermissionError as e:
+        _handle_rm_error(os.remove, path, e, root=path)
+
+def _remove_tree(path: str):
+    """Removes a directory tree in a single pass, fixing up read-only entries as it goes."""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=functools.partial(_handle_rm_error, root=path))
+    else:
+        shutil.rmtree(path, onerror=lambda func, p, exc_info: _handle_rm_error(func, p, exc_info[1], root=path))
+
+def _find_processes(names: list[str]) -> list[str]:
+    """Returns the PIDs of running processes matching any of the given names, using a single listing call."""
+    if IS_WINDOWS:
+        result = subprocess.run(["tasklist", "/FO", "CSV", "/NH"], check=False, capture_output=True, text=True, timeout=5)
+        wanted = {name.lower() for name in names}
+        return [row[1] for row in csv.reader(result.stdout.splitlines()) if len(row) > 1 and row[0].lower() in wanted]
+
+    # pgrep takes an extended regex, so each name is escaped to match only itself.
+    pattern = "|".join(re.sub(r"([.^$*+?()\[\]{}|\\])", r"\\\1", name) for name in names)
+    result = subprocess.run(["pgrep", "-f", pattern], check=False, capture_output=True, text=True, timeout=5)
+    # Never match this script or the shell that launched it, whose command lines may mention the names.
+    own_pids = {str(os.getpid()), str(os.getppid())}
+    return [pid for pid in result.stdout.split() if pid not in own_pids]
+
 def stop_dev_servers(root_dir: str, output: bool = False):
     """Stops running development servers using cross-platform commands."""
     if output:
@@ -307,48 +412,47 @@ def stop_dev_servers(root_dir: str, output: bool = False):
         f"node{executable_ext}",
         f"{app_name}{executable_ext}"
     ]
-    
-    for proc_name in lingering_processes:
-        if output:
-            print(f"{DIM}Attempting to stop process: {proc_name}...{RRR}", end="", flush=True)
-        try:
-            if IS_WINDOWS:
-                result = subprocess.run(
-                    [commands["kill_cmd"]] + commands["kill_args"] + [proc_name], 
-                    check=False, 
-                    capture_output=True,
-                    timeout=5 # Reduced timeout
-                )
-            else:
-                # For Unix-like systems, use pkill with pattern matching
-                result = subprocess.run(
-                    [commands["kill_cmd"]] + commands["kill_args"] + [proc_name.replace(executable_ext, "")], 
-                    check=False, 
-                    capture_output=True,
-                    timeout=5 # Reduced timeout
-                )
-            
-            # On Windows, error code 128 means "not found", which is a success for us.
-            # On Linux/macOS, error code 1 means "not found".
-            success_codes = [0, 128] if IS_WINDOWS else [0, 1]
 
+    if output:
+        print(f"{DIM}Looking for processes: {', '.join(lingering_processes)}...{RRR}", flush=True)
+    try:
+        pids = _find_processes(lingering_processes)
+        if not pids:
             if output:
-                if result.returncode in success_codes:
-                    print(f"\r{GRN}Stopped (or wasn't running): {proc_name.ljust(60)}{RRR}", flush=True)
-                else:
-                    print(f"\r{YLW}Could not stop {proc_name}. Return code: {result.returncode}{''.ljust(20)}{RRR}", flush=True)
+                print(f"{GRN}No development server processes are running.{RRR}", flush=True)
+            return
 
-        except FileNotFoundError:
-            if output:
-                print(f"\r{YLW}Process management tool '{commands['kill_cmd']}' not found.{''.ljust(30)}{RRR}", flush=True)
-            break 
-        except subprocess.TimeoutExpired:
-            if output:
-                print(f"\r{RED}Timeout trying to stop {proc_name}. It might be a zombie process.{''.ljust(20)}{RRR}", flush=True)
-    
-    if output:
-        print(f"{CYN}Waiting for processes to terminate fully...{RRR}", flush=True)
-    time.sleep(3)  # A brief pause to allow OS to release file handles.
+        # A single kill call covers every process instead of one call per name.
+        kill_command = [commands["kill_cmd"], *commands["kill_args"]]
+        for pid in pids:
+            kill_command += ["/PID", pid] if IS_WINDOWS else [pid]
+        result = subprocess.run(kill_command, check=False, capture_output=True, timeout=5)
+
+        if output:
+            print(f"{CYN}Waiting for processes to terminate fully...{RRR}", flush=True)
+        # Poll until the killed processes are gone so the OS has released their file handles,
+        # giving up after the same 3 seconds the old fixed pause used. The kill's exit code
+        # can't tell "already exited" from "not permitted", so the poll decides what stopped.
+        deadline = time.monotonic() + 3
+        while True:
+            remaining = set(_find_processes(lingering_processes)) & set(pids)
+            if not remaining or time.monotonic() >= deadline:
+                break
+            time.sleep(0.25)
+
+        if output:
+            stopped = len(pids) - len(remaining)
+            if not remaining:
+                print(f"{GRN}Stopped {stopped} process(es).{RRR}", flush=True)
+            else:
+                print(f"{YLW}Stopped {stopped} of {len(pids)} process(es). Still running: {', '.join(sorted(remaining))} (kill return code: {result.returncode}){RRR}", flush=True)
+
+    except FileNotFoundError as e:
+        if output:
+            print(f"{YLW}Process management tool '{e.filename}' not found.{RRR}", flush=True)
+    except subprocess.TimeoutExpired:
+        if output:
+            print(f"{RED}Timeout trying to stop processes. Some might be zombie processes.{RRR}", flush=True)
 
 def start_dev_servers(root_dir: str, output: bool = False):
     """Launches the development server and keeps the script running."""
@@ -363,6 +467,28 @@ def start_dev_servers(root_dir: str, output: bool = False):
     if output:
         print(f"\n{GRN}Development server process ended.{RRR}")
 
+def _iter_output_chunks(pipe):
+    """Yields raw output from a subprocess pipe, one bulk read per readiness event."""
+    fd = pipe.fileno()
+    if IS_WINDOWS:
+        # select() only supports sockets on Windows, so fall back to blocking reads.
+        yield from iter(lambda: os.read(fd, IO_CHUNK_SIZE), b"")
+        return
+
+    os.set_blocking(fd, False)
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            selector.select()
+            try:
+                chunk = os.read(fd, IO_CHUNK_SIZE)
+            except BlockingIOError:
+                continue  # Spurious wakeup; wait for the next readiness event.
+            if not chunk:
+                return
+            # Hand each chunk back straight away so output stays real-time and memory bounded.
+            yield chunk
+
 def _run_command(command: list[str], cwd: str, log_file_path: str, show_output: bool = True):
     """A centralized helper to run subprocess commands with real-time logging to console and file."""
     try:
@@ -370,25 +496,22 @@ def _run_command(command: list[str], cwd: str, log_file_path: str, show_output:
             command,
             cwd=cwd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
+            stderr=subprocess.STDOUT
         )
 
-        with open(log_file_path, 'a', encoding='utf-8') as log_file:
-            log_file.write(f"\n--- Running Command: {' '.join(command)} ---\n")
+        with open(log_file_path, 'ab', buffering=IO_CHUNK_SIZE) as log_file:
+            log_file.write(f"\n--- Running Command: {' '.join(command)} ---\n".encode('utf-8'))
+            log_file.flush()
             if show_output:
-                print(f"{DIM}--- Running Command: {' '.join(command)} ---{RRR}")
+                print(f"{DIM}--- Running Command: {' '.join(command)} ---{RRR}", flush=True)
 
-            while True:
-                line = process.stdout.readline()
-                if not line:
-                    break
+            # Drain the pipe in large raw chunks instead of line by line, so a verbose
+            # build costs a handful of read/write syscalls rather than several per line.
+            for chunk in _iter_output_chunks(process.stdout):
                 if show_output:
-                    print(line, end='')
-                log_file.write(line)
-                log_file.flush()
+                    sys.stdout.buffer.write(chunk)
+                    sys.stdout.buffer.flush()
+                log_file.write(chunk)
         
         return_code = process.wait()
         
@@ -433,9 +556,17 @@ def prepare_build_assets(root_dir: str, output: bool = False):
                     print(f"{YLW}Warning: Source asset '{src}' not found in '{source_icons_dir}'. Cannot prepare '{dest}'.{RRR}", flush=True)
 
 def install_dependencies(root_dir: str, output: bool = False):
-    """Installs npm dependencies if the node_modules directory is not present."""
+    """Installs npm dependencies if the node_modules directory is missing or empty."""
     node_modules_path = os.path.join(root_dir, 'node_modules')
-    if os.path.exists(node_modules_path):
+    # One scandir call both confirms the folder exists and that it isn't empty
+    # (e.g. left behind by an interrupted clean).
+    try:
+        with os.scandir(node_modules_path) as it:
+            has_dependencies = next(it, None) is not None
+    except OSError:
+        has_dependencies = False
+
+    if has_dependencies:
         if output:
             print(f"{GRN}Dependencies already exist. Skipping 'npm install'.{RRR}", flush=True)
         return
@@ -511,6 +642,73 @@ def init_project(root_dir, output=False):
 
 # --- History Logging Functions ---
 
+def _append_to_json_array(json_log_path: str, entry_str: str) -> bool:
+    """Appends an entry before the closing bracket of a JSON array file, touching only its tail.
+
+    Returns False if the file is missing or does not end with a closing bracket.
+    """
+    try:
+        with open(json_log_path, 'r+b') as f:
+            # Only the tail is needed to locate the closing bracket of the array.
+            size = f.seek(0, os.SEEK_END)
+            tail_start = max(0, size - 4096)
+            f.seek(tail_start)
+            tail = f.read().rstrip()
+            if not tail.endswith(b"]"):
+                return False
+            body = tail[:-1].rstrip()
+            separator = "" if body.endswith(b"[") else ","
+            f.seek(tail_start + len(body))
+            f.write(f"{separator}\n{entry_str}\n]".encode('utf-8'))
+            f.truncate()
+            return True
+    except FileNotFoundError:
+        return False
+
+def _recover_json_history(json_log_path: str) -> bool:
+    """Re-closes a history array that was cut off mid-write, at its last complete entry."""
+    with open(json_log_path, 'r+b') as f:
+        data = f.read()
+        end = len(data)
+        while True:
+            end = data.rfind(b"}", 0, end)
+            if end == -1:
+                return False
+            try:
+                history = json.loads(data[:end + 1] + b"]")
+            except ValueError:
+                continue
+            if isinstance(history, list):
+                f.seek(end + 1)
+                f.write(b"\n]")
+                f.truncate()
+                return True
+
+def _append_json_history(json_log_path: str, log_entry: dict):
+    """Appends an entry to the JSON history array, without re-reading the whole file."""
+    # Entries are stored compactly, one per line, which keeps the file small and quick to parse.
+    entry_str = json.dumps(log_entry, separators=(',', ':'))
+    if _append_to_json_array(json_log_path, entry_str):
+        return
+
+    # An append interrupted mid-write leaves the array unclosed; repair it rather than losing history.
+    if os.path.exists(json_log_path) and os.path.getsize(json_log_path) > 0:
+        if _recover_json_history(json_log_path) and _append_to_json_array(json_log_path, entry_str):
+            print(f"{YLW}Warning: '{json_log_path}' was incomplete and has been repaired.{RRR}", flush=True)
+            return
+
+        # Never overwrite history that can't be read; keep it aside for manual inspection.
+        backup_path = f"{json_log_path}.bak"
+        os.replace(json_log_path, backup_path)
+        print(f"{YLW}Warning: Could not parse '{json_log_path}'. Moved it to '{backup_path}' and started a new history.{RRR}", flush=True)
+
+    # Missing or empty history: start fresh. The new file is written beside the
+    # old one and swapped in atomically, so a crash can't leave a half-written history.
+    tmp_path = f"{json_log_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f"[\n{entry_str}\n]")
+    os.replace(tmp_path, json_log_path)
+
 def log_command_history(root_dir: str, command: str):
     """Logs the executed script command to JSON and MDC files for history and AI context."""
     
@@ -532,26 +730,15 @@ def log_command_history(root_dir: str, command: str):
     }
 
     # --- Update JSON Log ---
-    history = []
-    if os.path.exists(json_log_path):
-        try:
-            with open(json_log_path, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            # If file is corrupt or unreadable, start fresh
-            history = []
-    
-    history.append(log_entry)
-    with open(json_log_path, 'w', encoding='utf-8') as f:
-        json.dump(history, f, indent=4)
+    _append_json_history(json_log_path, log_entry)
 
     # --- Update MDC Log ---
     mdc_header = "---\nalwaysApply: true\n---\n\n"
-    if not os.path.exists(mdc_log_path):
-        with open(mdc_log_path, 'w', encoding='utf-8') as f:
-            f.write(mdc_header)
-
     with open(mdc_log_path, 'a', encoding='utf-8') as f:
+        # A single handle covers both cases: an empty (new) file gets the header first.
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            f.write(mdc_header)
         f.write(f"```json\n{json.dumps(log_entry, indent=4)}\n```\n\n")
 
 